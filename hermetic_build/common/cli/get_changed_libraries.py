@@ -21,7 +21,7 @@ logging.basicConfig(level=logging.DEBUG, stream=sys.stderr)
 import os
 import click
 
-from common.model.generation_config import GenerationConfig
+from common.model.generation_config import load_baseline_and_current_configs
 from common.utils.generation_config_comparator import compare_config
 
 
@@ -74,9 +74,13 @@ def create(
             "A valid generation config has to be passed in as "
             "current-generation-config-path."
         )
+    baseline_config, current_config = load_baseline_and_current_configs(
+        baseline_path=baseline_generation_config_path,
+        current_path=current_generation_config_path,
+    )
     config_change = compare_config(
-        baseline_config=GenerationConfig.from_yaml(baseline_generation_config_path),
-        current_config=GenerationConfig.from_yaml(current_generation_config_path),
+        baseline_config=baseline_config,
+        current_config=current_config,
     )
     click.echo(",".join(config_change.get_changed_libraries()))
 
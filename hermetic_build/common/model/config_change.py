@@ -43,12 +43,16 @@ class HashLibrary:
     Data class to group a LibraryConfig object and its hash value together.
     """
 
+    __slots__ = ("hash_value", "library")
+
     def __init__(self, hash_value: int, library: LibraryConfig):
         self.hash_value = hash_value
         self.library = library
 
 
 class LibraryChange:
+    __slots__ = ("changed_param", "current_value", "library_name")
+
     def __init__(self, changed_param: str, current_value: str, library_name: str = ""):
         self.changed_param = changed_param
         self.current_value = current_value
@@ -56,6 +60,8 @@ class LibraryChange:
 
 
 class QualifiedCommit:
+    __slots__ = ("commit", "libraries")
+
     def __init__(self, commit: Commit, libraries: set[str]):
         self.commit = commit
         self.libraries = libraries
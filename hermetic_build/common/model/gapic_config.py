@@ -17,6 +17,7 @@ from typing import Optional
 
 ALPHA_VERSION = "alpha"
 BETA_VERSION = "beta"
+version_regex = re.compile(r"^v[1-9]+(p[1-9]+)*(alpha|beta)?.*")
 
 
 class GapicConfig:
@@ -25,9 +26,15 @@ class GapicConfig:
     a generation_config.yaml
     """
 
+    __slots__ = ("proto_path", "version", "__depth", "__stable")
+
     def __init__(self, proto_path: str):
         self.proto_path = proto_path
         self.version = self.__parse_version()
+        # sorting calls __lt__ O(log N) times per config, so compute the
+        # comparison inputs once.
+        self.__depth = len(proto_path.split("/"))
+        self.__stable = self.is_stable()
 
     def is_stable(self):
         return (
@@ -40,7 +47,6 @@ class GapicConfig:
         return self.version
 
     def __parse_version(self) -> Optional[str]:
-        version_regex = re.compile(r"^v[1-9]+(p[1-9]+)*(alpha|beta)?.*")
         for directory in self.proto_path.split("/"):
             if version_regex.search(directory):
                 return directory
@@ -59,12 +65,10 @@ class GapicConfig:
 
         self_version = self.get_version()
         other_version = other.get_version()
-        self_dirs = self.proto_path.split("/")
-        other_dirs = other.proto_path.split("/")
         # Case 1: if both of the configs don't have a version in proto_path,
         # the one with lower depth is smaller.
         if (not self_version) and (not other_version):
-            return len(self_dirs) < len(other_dirs)
+            return self.__depth < other.__depth
         # Case 2: if only one config has a version in proto_path, it is smaller
         # than the other one.
         if self_version and (not other_version):
@@ -72,8 +76,8 @@ class GapicConfig:
         if (not self_version) and other_version:
             return False
         # Two configs both have a version in proto_path.
-        self_stable = self.is_stable()
-        other_stable = other.is_stable()
+        self_stable = self.__stable
+        other_stable = other.__stable
         # Case 3, if only config has a stable version in proto_path, it is
         # smaller than the other one.
         if self_stable and (not other_stable):
@@ -91,8 +95,8 @@ class GapicConfig:
         # Two configs both have a stable version in proto_path.
         # Case 5, if two configs have different depth in proto_path, the one
         # with lower depth is smaller.
-        if len(self_dirs) != len(other_dirs):
-            return len(self_dirs) < len(other_dirs)
+        if self.__depth != other.__depth:
+            return self.__depth < other.__depth
         # Case 6, the config with higher stable version is smaller.
         self_num = int(self_version[1:])
         other_num = int(other_version[1:])
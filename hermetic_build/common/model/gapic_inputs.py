@@ -31,19 +31,17 @@ java_gapic_assembly_gradle_pkg\(
 (.*?)
 \)
 """
-# match a line which the first character is "#".
-comment_pattern = r"^\s*\#+"
-pattern_to_proto = {
-    r"//google/cloud:common_resources_proto": "google/cloud/common_resources.proto",
-    r"//google/cloud/location:location_proto": "google/cloud/location/locations.proto",
-    r"//google/iam/v1:iam_policy_proto": "google/iam/v1/iam_policy.proto",
+target_to_proto = {
+    "//google/cloud:common_resources_proto": "google/cloud/common_resources.proto",
+    "//google/cloud/location:location_proto": "google/cloud/location/locations.proto",
+    "//google/iam/v1:iam_policy_proto": "google/iam/v1/iam_policy.proto",
 }
 transport_pattern = r"transport = \"(.*?)\""
-rest_pattern = r"rest_numeric_enums = True"
+rest_numeric_enums_enabled = "rest_numeric_enums = True"
 gapic_yaml_pattern = r"gapic_yaml = \"(.*?)\""
 service_config_pattern = r"grpc_service_config = \"(.*?)\""
 service_yaml_pattern = r"service_yaml = \"(.*?)\""
-include_samples_pattern = r"include_samples = True"
+include_samples_enabled = "include_samples = True"
 
 
 class GapicInputs:
@@ -52,6 +50,17 @@ class GapicInputs:
     a GAPIC library.
     """
 
+    __slots__ = (
+        "proto_only",
+        "additional_protos",
+        "transport",
+        "rest_numeric_enum",
+        "gapic_yaml",
+        "service_config",
+        "service_yaml",
+        "include_samples",
+    )
+
     def __init__(
         self,
         proto_only="true",
@@ -144,14 +153,14 @@ def __parse_additional_protos(proto_library_target: str) -> str:
     res = [" "]
     lines = proto_library_target.split("\n")
     for line in lines:
-        if len(re.findall(comment_pattern, line)) != 0:
+        if line.lstrip().startswith("#"):
             # skip a line which the first charactor is "#" since it's
             # a comment.
             continue
-        for pattern in pattern_to_proto:
-            if len(re.findall(pattern, line)) == 0:
+        for target, proto in target_to_proto.items():
+            if target not in line:
                 continue
-            res.append(pattern_to_proto[pattern])
+            res.append(proto)
     return " ".join(res)
 
 
@@ -161,8 +170,7 @@ def __parse_transport(gapic_target: str) -> str:
 
 
 def __parse_rest_numeric_enums(gapic_target: str) -> str:
-    rest_numeric_enums = re.findall(rest_pattern, gapic_target)
-    return "true" if len(rest_numeric_enums) != 0 else "false"
+    return "true" if rest_numeric_enums_enabled in gapic_target else "false"
 
 
 def __parse_gapic_yaml(gapic_target: str, versioned_path: str) -> str:
@@ -192,5 +200,4 @@ def __parse_service_yaml(gapic_target: str, versioned_path: str) -> str:
 
 
 def __parse_include_samples(assembly_target: str) -> str:
-    include_samples = re.findall(include_samples_pattern, assembly_target)
-    return "true" if len(include_samples) != 0 else "false"
+    return "true" if include_samples_enabled in assembly_target else "false"
@@ -12,6 +12,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import filecmp
 import os
 
 import yaml
@@ -19,6 +20,12 @@ from typing import Optional
 from common.model.library_config import LibraryConfig
 from common.model.gapic_config import GapicConfig
 
+try:
+    # prefer the libyaml-backed loader, if PyYAML is built with it.
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 REPO_LEVEL_PARAMETER = "Repo level parameter"
 LIBRARY_LEVEL_PARAMETER = "Library level parameter"
 GAPIC_LEVEL_PARAMETER = "GAPIC level parameter"
@@ -61,8 +68,9 @@ class GenerationConfig:
         """
         paths = {}
         for library in self.libraries:
+            library_name = library.get_library_name()
             for gapic_config in library.gapic_configs:
-                paths[gapic_config.proto_path] = library.get_library_name()
+                paths[gapic_config.proto_path] = library_name
         return paths
 
     def is_monorepo(self) -> bool:
@@ -112,8 +120,8 @@ class GenerationConfig:
         :param path_to_yaml: the path to the configuration file
         :return the parsed configuration represented by the "model" classes
         """
-        with open(path_to_yaml, "r") as file_stream:
-            config = yaml.safe_load(file_stream)
+        with open(path_to_yaml, "rb") as file_stream:
+            config = yaml.load(file_stream, Loader=SafeLoader)
 
         libraries = _required(config, "libraries", REPO_LEVEL_PARAMETER)
         if not libraries:
@@ -175,6 +183,23 @@ class GenerationConfig:
         return parsed_config
 
 
+def load_baseline_and_current_configs(
+    baseline_path: str, current_path: str
+) -> tuple[GenerationConfig, GenerationConfig]:
+    """
+    Parses the baseline and current generation configs.
+    If the two files are identical, the current one is not parsed and the
+    baseline config is returned for both.
+    :param baseline_path: the path to the baseline configuration file
+    :param current_path: the path to the current configuration file
+    :return a tuple of the baseline and current configurations
+    """
+    baseline_config = GenerationConfig.from_yaml(baseline_path)
+    if filecmp.cmp(baseline_path, current_path, shallow=False):
+        return baseline_config, baseline_config
+    return baseline_config, GenerationConfig.from_yaml(current_path)
+
+
 def _required(config: dict, key: str, level: str = LIBRARY_LEVEL_PARAMETER):
     if key not in config:
         message = (
@@ -151,7 +151,6 @@ class LibraryConfig:
             and self.api_description == other.api_description
             and self.name_pretty == other.name_pretty
             and self.product_documentation == other.product_documentation
-            and self.gapic_configs == other.gapic_configs
             and self.library_type == other.library_type
             and self.release_level == other.release_level
             and self.api_id == other.api_id
@@ -173,6 +172,9 @@ class LibraryConfig:
             and self.recommended_package == other.recommended_package
             and self.min_java_version == other.min_java_version
             and self.transport == other.transport
+            # compare the list last so that a difference in a scalar
+            # parameter short-circuits the element-wise comparison.
+            and self.gapic_configs == other.gapic_configs
         )
 
     def __hash__(self):
@@ -12,9 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import os
+import shutil
+import tempfile
 import unittest
 from pathlib import Path
 from common.model.generation_config import GenerationConfig
+from common.model.generation_config import load_baseline_and_current_configs
 from common.model.library_config import LibraryConfig
 
 script_dir = os.path.dirname(os.path.realpath(__file__))
@@ -256,3 +259,37 @@ class GenerationConfigTest(unittest.TestCase):
             GenerationConfig.from_yaml,
             f"{test_config_dir}/config_without_gapics_value.yaml",
         )
+
+    def test_load_baseline_and_current_configs_with_identical_files_parses_once(
+        self,
+    ):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            current_path = f"{tmp_dir}/generation_config.yaml"
+            shutil.copy(f"{test_config_dir}/generation_config.yaml", current_path)
+            baseline_config, current_config = load_baseline_and_current_configs(
+                baseline_path=f"{test_config_dir}/generation_config.yaml",
+                current_path=current_path,
+            )
+        self.assertIs(baseline_config, current_config)
+
+    def test_load_baseline_and_current_configs_with_different_files_parses_both(
+        self,
+    ):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            current_path = f"{tmp_dir}/generation_config.yaml"
+            with open(f"{test_config_dir}/generation_config.yaml") as f:
+                content = f.read()
+            with open(current_path, "w") as f:
+                f.write(
+                    content.replace(
+                        "libraries_bom_version: 26.37.0",
+                        "libraries_bom_version: 26.38.0",
+                    )
+                )
+            baseline_config, current_config = load_baseline_and_current_configs(
+                baseline_path=f"{test_config_dir}/generation_config.yaml",
+                current_path=current_path,
+            )
+        self.assertIsNot(baseline_config, current_config)
+        self.assertEqual("26.37.0", baseline_config.libraries_bom_version)
+        self.assertEqual("26.38.0", current_config.libraries_bom_version)
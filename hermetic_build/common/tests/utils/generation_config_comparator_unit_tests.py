@@ -487,6 +487,35 @@ class GenerationConfigComparatorTest(unittest.TestCase):
         self.assertEqual("extra module", config_change.current_value)
         self.assertEqual("existing_library", config_change.library_name)
 
+    def test_compare_config_min_java_version_update(self):
+        self.current_config.libraries[0].min_java_version = 17
+        result = compare_config(
+            baseline_config=self.baseline_config,
+            current_config=self.current_config,
+        )
+        self.assertTrue(
+            len(result.change_to_libraries[ChangeType.LIBRARY_LEVEL_CHANGE]) == 1
+        )
+        config_change = result.change_to_libraries[ChangeType.LIBRARY_LEVEL_CHANGE][0]
+        self.assertEqual("min_java_version", config_change.changed_param)
+        self.assertEqual(17, config_change.current_value)
+        self.assertEqual("existing_library", config_change.library_name)
+
+    def test_compare_config_min_java_version_int_update(self):
+        self.baseline_config.libraries[0].min_java_version = 11
+        self.current_config.libraries[0].min_java_version = 17
+        result = compare_config(
+            baseline_config=self.baseline_config,
+            current_config=self.current_config,
+        )
+        self.assertTrue(
+            len(result.change_to_libraries[ChangeType.LIBRARY_LEVEL_CHANGE]) == 1
+        )
+        config_change = result.change_to_libraries[ChangeType.LIBRARY_LEVEL_CHANGE][0]
+        self.assertEqual("min_java_version", config_change.changed_param)
+        self.assertEqual(17, config_change.current_value)
+        self.assertEqual("existing_library", config_change.library_name)
+
     def test_compare_config_version_addition(self):
         self.current_config.libraries[0].gapic_configs = [
             GapicConfig(proto_path="google/new/library/v1")
@@ -500,3 +529,4 @@ class GenerationConfigComparatorTest(unittest.TestCase):
         self.assertEqual("", config_change.changed_param)
         self.assertEqual("google/new/library/v1", config_change.current_value)
         self.assertEqual("existing_library", config_change.library_name)
+        self.assertNotIn(ChangeType.LIBRARY_LEVEL_CHANGE, result.change_to_libraries)
@@ -49,15 +49,17 @@ def compare_config(
         obj=current_config, excluded_params=excluded_params
     )
 
-    for baseline_param, current_param in zip(baseline_params, current_params):
-        if baseline_param == current_param:
-            continue
-        if baseline_param[0] == "googleapis_commitish":
+    for param, value in __diff_sorted_params(
+        baseline_params=baseline_params,
+        current_params=current_params,
+        current_obj=current_config,
+    ):
+        if param == "googleapis_commitish":
             diff[ChangeType.GOOGLEAPIS_COMMIT] = []
         else:
             config_change = LibraryChange(
-                changed_param=current_param[0],
-                current_value=current_param[1],
+                changed_param=param,
+                current_value=value,
             )
             diff[ChangeType.REPO_LEVEL_CHANGE].append(config_change)
 
@@ -166,19 +168,27 @@ def __compare_changed_libraries(
     for library_name in changed_libraries:
         baseline_library = baseline_libraries[library_name].library
         current_library = current_libraries[library_name].library
-        baseline_params = __convert_params_to_sorted_list(baseline_library)
-        current_params = __convert_params_to_sorted_list(current_library)
-        for baseline_param, current_param in zip(baseline_params, current_params):
-            if baseline_param == current_param:
-                continue
-            if baseline_param[0] == "api_shortname":
+        # gapic_configs are compared separately in __compare_gapic_configs.
+        excluded_params = {"gapic_configs"}
+        baseline_params = __convert_params_to_sorted_list(
+            obj=baseline_library, excluded_params=excluded_params
+        )
+        current_params = __convert_params_to_sorted_list(
+            obj=current_library, excluded_params=excluded_params
+        )
+        for param, value in __diff_sorted_params(
+            baseline_params=baseline_params,
+            current_params=current_params,
+            current_obj=current_library,
+        ):
+            if param == "api_shortname":
                 raise ValueError(
                     f"{library_name}: api_shortname must not change when library_name remains the same."
                 )
             else:
                 config_change = LibraryChange(
-                    changed_param=current_param[0],
-                    current_value=current_param[1],
+                    changed_param=param,
+                    current_value=value,
                     library_name=library_name,
                 )
                 diff[ChangeType.LIBRARY_LEVEL_CHANGE].append(config_change)
@@ -234,6 +244,7 @@ def __convert_params_to_sorted_list(obj: Any, excluded_params=None) -> List[tupl
 
     - str
     - bool
+    - int
     - list[str]
     - None
 
@@ -254,11 +265,13 @@ def __convert_params_to_sorted_list(obj: Any, excluded_params=None) -> List[tupl
             # skip if the type of param is not one of the following types
             # 1. str
             # 2. bool
-            # 3. list[str]
-            # 4. None
+            # 3. int
+            # 4. list[str]
+            # 5. None
             or not (
                 isinstance(getattr(obj, param), str)
                 or isinstance(getattr(obj, param), bool)
+                or isinstance(getattr(obj, param), int)
                 or __is_list_of_str(obj=obj, param=param)
                 or getattr(obj, param) is None
             )
@@ -268,6 +281,49 @@ def __convert_params_to_sorted_list(obj: Any, excluded_params=None) -> List[tupl
     return sorted(param_and_values)
 
 
+def __diff_sorted_params(
+    baseline_params: List[tuple], current_params: List[tuple], current_obj: Any
+) -> List[tuple]:
+    """
+    Walk two lists of (param, value) tuples, both sorted by param, in a
+    single pass and return the (param, current value) of each changed param.
+
+    A param that only exists in one of the lists is a changed param, e.g.,
+    a param whose value is a supported type in one object and an unsupported
+    type in the other. The current value is always read from current_obj, so
+    it's the real value even if the param is not in current_params.
+
+    :param baseline_params: a sorted list of tuples of the baseline object.
+    :param current_params: a sorted list of tuples of the current object.
+    :param current_obj: the current object.
+    :return: a list of tuples of changed params and their current values.
+    """
+    changed_params = []
+    baseline_index, current_index = 0, 0
+    while baseline_index < len(baseline_params) and current_index < len(current_params):
+        baseline_param, baseline_value = baseline_params[baseline_index]
+        current_param, current_value = current_params[current_index]
+        if baseline_param < current_param:
+            changed_params.append(
+                (baseline_param, getattr(current_obj, baseline_param, None))
+            )
+            baseline_index += 1
+        elif baseline_param > current_param:
+            changed_params.append((current_param, current_value))
+            current_index += 1
+        else:
+            if baseline_value != current_value:
+                changed_params.append((current_param, current_value))
+            baseline_index += 1
+            current_index += 1
+    changed_params.extend(
+        (param, getattr(current_obj, param, None))
+        for param, _ in baseline_params[baseline_index:]
+    )
+    changed_params.extend(current_params[current_index:])
+    return changed_params
+
+
 def __is_list_of_str(obj: Any, param: str) -> bool:
     """
     Returns True if the type of param of a given object is a list of str; False
@@ -13,8 +13,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import re
+from functools import lru_cache
 
+version_regex = re.compile(r"^v[1-9].*")
 
+
+@lru_cache(maxsize=4096)
 def find_versioned_proto_path(proto_path: str) -> str:
     """
     Returns a versioned proto_path from a given proto_path; or proto_path itself
@@ -22,7 +26,6 @@ def find_versioned_proto_path(proto_path: str) -> str:
     :param proto_path: a proto file path
     :return: the versioned proto_path
     """
-    version_regex = re.compile(r"^v[1-9].*")
     directories = proto_path.split("/")
     for directory in directories:
         result = version_regex.search(directory)
@@ -42,7 +45,6 @@ def ends_with_version(proto_path: str) -> bool:
     :return:
         True if the proto_path ends with a version, False otherwise.
     """
-    version_regex = re.compile(r"^v[1-9].*")
     parts = proto_path.rsplit("/", 1)
     if len(parts) > 1:
         last_part = parts[1]
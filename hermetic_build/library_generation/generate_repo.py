@@ -140,7 +140,6 @@ def _get_target_libraries_from_api_path(
         raise ValueError("api_path is not ending with a version is not supported")
     target_libraries = []
     for library in config.libraries:
-        target_library = copy.deepcopy(library)
         gapic_config_list = []
         for item in library.gapic_configs:
             if item.proto_path == target_api_path or not ends_with_version(
@@ -148,6 +147,9 @@ def _get_target_libraries_from_api_path(
             ):
                 gapic_config_list.append(GapicConfig(item.proto_path))
         if gapic_config_list:
+            # only copy the library that is returned, the gapic configs of
+            # the copy are replaced right away.
+            target_library = copy.deepcopy(library)
             target_library.set_gapic_configs(gapic_config_list)
             target_libraries.append(target_library)
             return target_libraries
@@ -19,6 +19,14 @@ class BomConfig:
     Class that represents an entry in dependencyManagement section.
     """
 
+    __slots__ = (
+        "group_id",
+        "artifact_id",
+        "version",
+        "version_annotation",
+        "is_import",
+    )
+
     def __init__(
         self,
         group_id: str,
@@ -103,11 +103,11 @@ def update_cloud_pom(
     root = tree.getroot()
     dependencies = root.find("{http://maven.apache.org/POM/4.0.0}dependencies")
 
-    existing_dependencies = [
+    existing_dependencies = {
         m.find("{http://maven.apache.org/POM/4.0.0}artifactId").text
         for m in dependencies
         if m.find("{http://maven.apache.org/POM/4.0.0}artifactId") is not None
-    ]
+    }
 
     if is_monorepo:
         _set_test_scoped_deps(dependencies)
@@ -138,9 +138,7 @@ def update_cloud_pom(
             new_scope = etree.Element("{http://maven.apache.org/POM/4.0.0}scope")
             new_scope.text = "test"
             new_scope.tail = "\n    "
-            new_dependency.append(new_group)
-            new_dependency.append(new_artifact)
-            new_dependency.append(new_scope)
+            new_dependency.extend((new_group, new_artifact, new_scope))
             dependencies.insert(grpc_index + 1, new_dependency)
 
     try:
@@ -170,8 +168,7 @@ def update_cloud_pom(
                 )
                 new_artifact.text = m.artifact_id
                 new_artifact.tail = "\n    "
-                new_dependency.append(new_group)
-                new_dependency.append(new_artifact)
+                new_dependency.extend((new_group, new_artifact))
                 dependencies.insert(proto_index + 1, new_dependency)
 
     tree.write(filename, pretty_print=True, xml_declaration=True, encoding="utf-8")
@@ -218,8 +215,9 @@ def update_parent_pom(filename: str, modules: List[module.Module]):
     existing = root.find("{http://maven.apache.org/POM/4.0.0}modules")
 
     module_names = [m.artifact_id for m in modules]
+    known_module_names = set(module_names)
     extra_modules = [
-        m.text for i, m in enumerate(existing) if m.text not in module_names
+        m.text for i, m in enumerate(existing) if m.text not in known_module_names
     ]
 
     modules_to_write = module_names + extra_modules
@@ -244,12 +242,11 @@ def update_parent_pom(filename: str, modules: List[module.Module]):
         "{http://maven.apache.org/POM/4.0.0}dependencyManagement"
     ).find("{http://maven.apache.org/POM/4.0.0}dependencies")
 
-    existing_dependencies = [
+    existing_dependencies = {
         m.find("{http://maven.apache.org/POM/4.0.0}artifactId").text
         for m in dependencies
         if m.find("{http://maven.apache.org/POM/4.0.0}artifactId") is not None
-    ]
-    insert_index = 1
+    }
 
     num_modules = len(modules)
 
@@ -270,10 +267,7 @@ def update_parent_pom(filename: str, modules: List[module.Module]):
         new_version.text = m.version
         comment = etree.Comment(" {x-version-update:" + m.artifact_id + ":current} ")
         comment.tail = "\n      "
-        new_dependency.append(new_group)
-        new_dependency.append(new_artifact)
-        new_dependency.append(new_version)
-        new_dependency.append(comment)
+        new_dependency.extend((new_group, new_artifact, new_version, comment))
         new_dependency.tail = "\n      "
         dependencies.insert(1, new_dependency)
 
@@ -307,10 +301,7 @@ def update_bom_pom(filename: str, modules: List[module.Module]):
         new_version.text = m.version
         comment = etree.Comment(" {x-version-update:" + m.artifact_id + ":current} ")
         comment.tail = "\n      "
-        new_dependency.append(new_group)
-        new_dependency.append(new_artifact)
-        new_dependency.append(new_version)
-        new_dependency.append(comment)
+        new_dependency.extend((new_group, new_artifact, new_version, comment))
 
         if index == num_modules - 1:
             new_dependency.tail = "\n    "
@@ -368,17 +359,18 @@ def main(versions_file, monorepo):
     else:
         extra_managed_modules = ""
 
-    # list of modules to be excluded from added to poms
+    # modules to be excluded from added to poms. It's a set since it's
+    # checked against every module in versions.txt.
     if "excluded_dependencies" in repo_metadata:
-        excluded_dependencies_list = repo_metadata["excluded_dependencies"].split(",")
+        excluded_dependencies = set(repo_metadata["excluded_dependencies"].split(","))
     else:
-        excluded_dependencies_list = ""
+        excluded_dependencies = set()
 
-    # list of poms that have to be excluded from post processing
+    # poms that have to be excluded from post processing
     if "excluded_poms" in repo_metadata:
-        excluded_poms_list = repo_metadata["excluded_poms"].split(",")
+        excluded_poms = set(repo_metadata["excluded_poms"].split(","))
     else:
-        excluded_poms_list = ""
+        excluded_poms = set()
 
     # Missing Case 1: When this library ('java-XXX' module) is new.
     if artifact_id not in existing_modules:
@@ -417,7 +409,7 @@ def main(versions_file, monorepo):
 
     required_dependencies = {}
     for dependency_module in existing_modules:
-        if dependency_module in excluded_dependencies_list:
+        if dependency_module in excluded_dependencies:
             continue
         dep_artifact_id = existing_modules[dependency_module].artifact_id
         if monorepo and not os.path.isdir(dep_artifact_id):
@@ -438,7 +430,7 @@ def main(versions_file, monorepo):
                 release_version=main_module.release_version,
             )
             if (
-                path not in excluded_dependencies_list
+                path not in excluded_dependencies
                 and path not in main_module.artifact_id
             ):
                 required_dependencies[path] = module.Module(
@@ -458,7 +450,7 @@ def main(versions_file, monorepo):
                 monorepo=monorepo,
             )
             if (
-                path not in excluded_dependencies_list
+                path not in excluded_dependencies
                 and path not in main_module.artifact_id
             ):
                 required_dependencies[path] = module.Module(
@@ -477,7 +469,7 @@ def main(versions_file, monorepo):
                 release_version=main_module.release_version,
             )
             if (
-                path not in excluded_dependencies_list
+                path not in excluded_dependencies
                 and path not in main_module.artifact_id
             ):
                 required_dependencies[path] = module.Module(
@@ -500,7 +492,7 @@ def main(versions_file, monorepo):
                 monorepo=monorepo,
             )
             if (
-                path not in excluded_dependencies_list
+                path not in excluded_dependencies
                 and path not in main_module.artifact_id
             ):
                 required_dependencies[path] = module.Module(
@@ -532,11 +524,11 @@ def main(versions_file, monorepo):
 
     if os.path.isfile(f"{artifact_id}/pom.xml"):
         print("updating modules in cloud pom.xml")
-        if artifact_id not in excluded_poms_list:
+        if artifact_id not in excluded_poms:
             update_cloud_pom(
                 f"{artifact_id}/pom.xml", proto_modules, grpc_modules, monorepo
             )
-    elif artifact_id not in excluded_poms_list:
+    elif artifact_id not in excluded_poms:
         print("creating missing cloud pom.xml")
         templates.render(
             template_name="cloud_pom.xml.j2",
@@ -553,9 +545,9 @@ def main(versions_file, monorepo):
 
     if os.path.isfile(f"{artifact_id}-bom/pom.xml"):
         print("updating modules in bom pom.xml")
-        if artifact_id + "-bom" not in excluded_poms_list:
+        if artifact_id + "-bom" not in excluded_poms:
             update_bom_pom(f"{artifact_id}-bom/pom.xml", modules)
-    elif artifact_id + "-bom" not in excluded_poms_list:
+    elif artifact_id + "-bom" not in excluded_poms:
         print("creating missing bom pom.xml")
         monorepo_version = __get_monorepo_version(versions_file) if monorepo else ""
         templates.render(
@@ -24,6 +24,12 @@ from pathlib import Path
 from typing import Any, Optional, Dict, Iterable, List
 from datetime import date
 
+try:
+    # prefer the libyaml-backed loader and dumper, if PyYAML is built with it.
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
 logger = logging.getLogger()
 logger.setLevel(logging.DEBUG)
 
@@ -143,7 +149,7 @@ def version_from_maven_metadata(metadata: str) -> Optional[str]:
 def _merge_release_please(destination_text: str):
     handle_gh_release_key = "handleGHRelease"
     branches_key = "branches"
-    config = yaml.safe_load(destination_text)
+    config = yaml.load(destination_text, Loader=SafeLoader)
     if handle_gh_release_key in config:
         return destination_text
 
@@ -152,7 +158,7 @@ def _merge_release_please(destination_text: str):
     if branches_key in config:
         for branch in config[branches_key]:
             branch[handle_gh_release_key] = True
-    return yaml.dump(config)
+    return yaml.dump(config, Dumper=SafeDumper)
 
 
 def _merge_common_templates(
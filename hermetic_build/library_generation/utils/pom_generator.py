@@ -11,10 +11,13 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from lxml import etree
 from typing import List
+from typing import Optional
 
 from library_generation.model.bom_config import BomConfig
 from library_generation.utils.file_render import render
@@ -23,6 +26,11 @@ project_tag = "{http://maven.apache.org/POM/4.0.0}"
 group_id_tag = "groupId"
 artifact_tag = "artifactId"
 version_tag = "version"
+group_id_inclusions = [
+    "com.google.cloud",
+    "com.google.analytics",
+    "com.google.area120",
+]
 
 
 def generate_root_pom(repository_path: str) -> None:
@@ -72,9 +80,12 @@ def __search_for_java_modules(
 ) -> List[str]:
     repo = Path(repository_path).resolve()
     modules = []
-    for sub_dir in repo.iterdir():
-        if sub_dir.is_dir() and sub_dir.name.startswith("java-"):
-            modules.append(sub_dir.name)
+    # DirEntry caches the file type from the directory listing, so this
+    # doesn't stat every entry of the repository.
+    with os.scandir(repo) as sub_dirs:
+        for sub_dir in sub_dirs:
+            if sub_dir.is_dir() and sub_dir.name.startswith("java-"):
+                modules.append(sub_dir.name)
     return sorted(modules)
 
 
@@ -83,33 +94,23 @@ def __search_for_bom_artifact(
 ) -> List[BomConfig]:
     repo = Path(repository_path).resolve()
     module_exclusions = ["gapic-libraries-bom"]
-    group_id_inclusions = [
-        "com.google.cloud",
-        "com.google.analytics",
-        "com.google.area120",
-    ]
-    bom_configs = []
-    for module in repo.iterdir():
-        if module.is_file() or module.name in module_exclusions:
-            continue
-        for sub_module in module.iterdir():
-            if sub_module.is_dir() and sub_module.name.endswith("-bom"):
-                root = etree.parse(f"{sub_module}/pom.xml").getroot()
-                group_id = root.find(f"{project_tag}{group_id_tag}").text
-                if group_id not in group_id_inclusions:
-                    continue
-                artifact_id = root.find(f"{project_tag}{artifact_tag}").text
-                version = root.find(f"{project_tag}{version_tag}").text
-                index = artifact_id.rfind("-")
-                version_annotation = artifact_id[:index]
-                bom_configs.append(
-                    BomConfig(
-                        group_id=group_id,
-                        artifact_id=artifact_id,
-                        version=version,
-                        version_annotation=version_annotation,
-                    )
-                )
+    bom_poms = []
+    with os.scandir(repo) as modules:
+        for module in modules:
+            if module.is_file() or module.name in module_exclusions:
+                continue
+            with os.scandir(module.path) as sub_modules:
+                for sub_module in sub_modules:
+                    if sub_module.is_dir() and sub_module.name.endswith("-bom"):
+                        bom_poms.append(f"{sub_module.path}/pom.xml")
+    # each pom is parsed independently and lxml releases the GIL while
+    # parsing a file, so parse them concurrently.
+    with ThreadPoolExecutor() as executor:
+        bom_configs = [
+            bom_config
+            for bom_config in executor.map(__parse_bom_config, bom_poms)
+            if bom_config is not None
+        ]
     # handle edge case: java-grafeas
     bom_configs += __handle_special_bom(
         repository_path=repository_path,
@@ -135,6 +136,23 @@ def __search_for_bom_artifact(
     return sorted(bom_configs)
 
 
+def __parse_bom_config(pom: str) -> Optional[BomConfig]:
+    root = etree.parse(pom).getroot()
+    group_id = root.find(f"{project_tag}{group_id_tag}").text
+    if group_id not in group_id_inclusions:
+        return None
+    artifact_id = root.find(f"{project_tag}{artifact_tag}").text
+    version = root.find(f"{project_tag}{version_tag}").text
+    index = artifact_id.rfind("-")
+    version_annotation = artifact_id[:index]
+    return BomConfig(
+        group_id=group_id,
+        artifact_id=artifact_id,
+        version=version,
+        version_annotation=version_annotation,
+    )
+
+
 def __handle_special_bom(
     repository_path: str,
     module: str,
@@ -14,6 +14,8 @@
 # limitations under the License.
 import re
 
+version_regex = re.compile(r"^v[1-9]")
+
 
 def remove_version_from(proto_path: str) -> str:
     """
@@ -21,9 +23,8 @@ def remove_version_from(proto_path: str) -> str:
     :param proto_path: versioned proto_path
     :return: the proto_path without version
     """
-    version_pattern = "^v[1-9]"
     index = proto_path.rfind("/")
     version = proto_path[index + 1 :]
-    if re.match(version_pattern, version):
+    if version_regex.match(version):
         return proto_path[:index]
     return proto_path
@@ -27,6 +27,25 @@ from library_generation.utils.proto_path_utils import remove_version_from
 
 script_dir = os.path.dirname(os.path.realpath(__file__))
 SDK_PLATFORM_JAVA = "googleapis/sdk-platform-java"
+# The mapping is needed because transport in .repo-metadata.json
+# is one of grpc, http and both.
+REPO_METADATA_TRANSPORT = {
+    "grpc": "grpc",
+    "rest": "http",
+}
+# library parameters written to .repo-metadata.json only if they are set.
+REPO_METADATA_OPTIONAL_FIELDS = (
+    "api_reference",
+    "codeowner_team",
+    "excluded_dependencies",
+    "excluded_poms",
+    "issue_tracker",
+    "rest_documentation",
+    "rpc_documentation",
+    "extra_versioned_modules",
+    "recommended_package",
+    "min_java_version",
+)
 
 
 def create_argument(arg_key: str, arg_container: object) -> List[str]:
@@ -87,7 +106,7 @@ def sh_util(statement: str, **kwargs) -> str:
         kwargs["stdout"] = subprocess.PIPE
     if "stderr" not in kwargs:
         kwargs["stderr"] = subprocess.PIPE
-    output = ""
+    output_lines = []
     with subprocess.Popen(
         [
             "bash",
@@ -101,13 +120,15 @@ def sh_util(statement: str, **kwargs) -> str:
             print(line.decode(), end="", flush=True)
         print("command stdout:")
         for line in proc.stdout:
-            print(line.decode(), end="", flush=True)
-            output += line.decode()
+            decoded_line = line.decode()
+            print(decoded_line, end="", flush=True)
+            output_lines.append(decoded_line)
         proc.wait()
         if proc.returncode != 0:
             raise RuntimeError(
                 f"function {statement} failed with exit code {proc.returncode}"
             )
+    output = "".join(output_lines)
     # captured stdout may contain a newline at the end, we remove it
     if len(output) > 0 and output[-1] == "\n":
         output = output[:-1]
@@ -208,14 +229,7 @@ def generate_postprocessing_prerequisite_files(
         else f"https://cloud.google.com/{language}/docs/reference/{artifact_id}/latest/overview"
     )
 
-    # The mapping is needed because transport in .repo-metadata.json
-    # is one of grpc, http and both,
-    if transport == "grpc":
-        converted_transport = "grpc"
-    elif transport == "rest":
-        converted_transport = "http"
-    else:
-        converted_transport = "both"
+    converted_transport = REPO_METADATA_TRANSPORT.get(transport, "both")
 
     repo_metadata = {
         "api_shortname": library.api_shortname,
@@ -239,26 +253,13 @@ def generate_postprocessing_prerequisite_files(
     if repo == SDK_PLATFORM_JAVA:
         repo_metadata.pop("api_id")
 
-    if library.api_reference:
-        repo_metadata["api_reference"] = library.api_reference
-    if library.codeowner_team:
-        repo_metadata["codeowner_team"] = library.codeowner_team
-    if library.excluded_dependencies:
-        repo_metadata["excluded_dependencies"] = library.excluded_dependencies
-    if library.excluded_poms:
-        repo_metadata["excluded_poms"] = library.excluded_poms
-    if library.issue_tracker:
-        repo_metadata["issue_tracker"] = library.issue_tracker
-    if library.rest_documentation:
-        repo_metadata["rest_documentation"] = library.rest_documentation
-    if library.rpc_documentation:
-        repo_metadata["rpc_documentation"] = library.rpc_documentation
-    if library.extra_versioned_modules:
-        repo_metadata["extra_versioned_modules"] = library.extra_versioned_modules
-    if library.recommended_package:
-        repo_metadata["recommended_package"] = library.recommended_package
-    if library.min_java_version:
-        repo_metadata["min_java_version"] = library.min_java_version
+    repo_metadata.update(
+        {
+            field: getattr(library, field)
+            for field in REPO_METADATA_OPTIONAL_FIELDS
+            if getattr(library, field)
+        }
+    )
 
     # generate .repo-meta.json
     json_file = ".repo-metadata.json"
@@ -15,7 +15,7 @@ import os
 from typing import Optional
 import click as click
 from release_note_generation.generate_pr_description import generate_pr_descriptions
-from common.model.generation_config import GenerationConfig
+from common.model.generation_config import load_baseline_and_current_configs
 from common.utils.generation_config_comparator import compare_config
 
 
@@ -85,9 +85,13 @@ def generate(
             "the description."
         )
         return
+    baseline_config, current_config = load_baseline_and_current_configs(
+        baseline_path=baseline_generation_config_path,
+        current_path=current_generation_config_path,
+    )
     config_change = compare_config(
-        baseline_config=GenerationConfig.from_yaml(baseline_generation_config_path),
-        current_config=GenerationConfig.from_yaml(current_generation_config_path),
+        baseline_config=baseline_config,
+        current_config=current_config,
     )
     generate_pr_descriptions(
         config_change=config_change,